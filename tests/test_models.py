@@ -0,0 +1,150 @@
+""" Parity between validated models and the model_construct builders used on API responses """
+from tools.google.youtube_tools import (
+    ChannelInfo,
+    PlaylistInfo,
+    VideoInfo,
+    VideoResults,
+    _dumps,
+    _parse_channel_search_item,
+    _parse_playlist_item_video,
+    _parse_playlist_search_item,
+    _parse_video_details,
+    _parse_video_search_item,
+)
+
+# Trimmed to the keys requested through the `fields=` selectors; counts are strings, as the API returns them
+VIDEO_DETAILS_ITEM = {
+    'id': 'dQw4w9WgXcQ',
+    'snippet': {
+        'channelId': 'UCuAXFkgsw1L7xaCfnd5JJOw',
+        'channelTitle': 'Rick Astley',
+        'title': 'Never Gonna Give You Up',
+        'description': 'The official video',
+        'publishedAt': '2009-10-25T06:57:33Z',
+        'tags': ['rick astley', 'never gonna give you up'],
+    },
+    'contentDetails': {'duration': 'PT3M33S', 'dimension': '2d'},
+    'statistics': {'viewCount': '1500000000', 'likeCount': '17000000', 'commentCount': '2300000'},
+    'topicDetails': {'topicCategories': ['https://en.wikipedia.org/wiki/Music']},
+    'paidProductPlacementDetails': {'hasPaidProductPlacement': False},
+}
+
+VIDEO_SEARCH_ITEM = {
+    'id': {'videoId': 'dQw4w9WgXcQ'},
+    'snippet': {
+        'channelId': 'UCuAXFkgsw1L7xaCfnd5JJOw',
+        'channelTitle': 'Rick Astley',
+        'title': 'Never Gonna Give You Up',
+        'description': 'The official video',
+        'publishTime': '2009-10-25T06:57:33Z',
+    },
+}
+
+PLAYLIST_ITEM = {
+    'snippet': {
+        'channelId': 'UCuAXFkgsw1L7xaCfnd5JJOw',
+        'channelTitle': 'Rick Astley',
+        'title': 'Never Gonna Give You Up',
+        'description': 'The official video',
+        'publishedAt': '2009-10-25T06:57:33Z',
+        'resourceId': {'videoId': 'dQw4w9WgXcQ'},
+    },
+}
+
+CHANNEL_SEARCH_ITEM = {
+    'id': {'channelId': 'UCuAXFkgsw1L7xaCfnd5JJOw'},
+    'snippet': {'title': 'Rick Astley', 'description': 'Official channel', 'publishedAt': '2006-01-01T00:00:00Z'},
+}
+
+PLAYLIST_SEARCH_ITEM = {
+    'id': {'playlistId': 'PLFgquLnL59alCl_2TQvOiD5Vgm1hCaGSI'},
+    'snippet': {
+        'channelId': 'UCuAXFkgsw1L7xaCfnd5JJOw',
+        'title': 'Greatest Hits',
+        'description': 'Playlist description',
+        'publishedAt': '2015-01-01T00:00:00Z',
+    },
+}
+
+
+def test_video_details_match_validated_model():
+    snippet = VIDEO_DETAILS_ITEM['snippet']
+    statistics = VIDEO_DETAILS_ITEM['statistics']
+    validated = VideoInfo(
+        channel_id=snippet['channelId'],
+        channel_title=snippet['channelTitle'],
+        video_id=VIDEO_DETAILS_ITEM['id'],
+        video_title=snippet['title'],
+        description=snippet['description'],
+        published_at=snippet['publishedAt'],
+        tags=snippet['tags'],
+        duration=VIDEO_DETAILS_ITEM['contentDetails']['duration'],
+        dimension=VIDEO_DETAILS_ITEM['contentDetails']['dimension'],
+        view_count=statistics['viewCount'],
+        like_count=statistics['likeCount'],
+        comment_count=statistics['commentCount'],
+        topic_categories=VIDEO_DETAILS_ITEM['topicDetails']['topicCategories'],
+        has_paid_product_placement=VIDEO_DETAILS_ITEM['paidProductPlacementDetails']['hasPaidProductPlacement'],
+    )
+
+    assert _parse_video_details(VIDEO_DETAILS_ITEM).model_dump() == validated.model_dump()
+
+
+def test_video_search_item_matches_validated_model():
+    snippet = VIDEO_SEARCH_ITEM['snippet']
+    validated = VideoInfo(
+        channel_id=snippet['channelId'],
+        channel_title=snippet['channelTitle'],
+        video_id=VIDEO_SEARCH_ITEM['id']['videoId'],
+        video_title=snippet['title'],
+        description=snippet['description'],
+        published_at=snippet['publishTime'],
+    )
+
+    assert _parse_video_search_item(VIDEO_SEARCH_ITEM).model_dump() == validated.model_dump()
+
+
+def test_playlist_item_video_matches_validated_model():
+    snippet = PLAYLIST_ITEM['snippet']
+    validated = VideoInfo(
+        channel_id=snippet['channelId'],
+        channel_title=snippet['channelTitle'],
+        video_id=snippet['resourceId']['videoId'],
+        video_title=snippet['title'],
+        description=snippet['description'],
+        published_at=snippet['publishedAt'],
+    )
+
+    assert _parse_playlist_item_video(PLAYLIST_ITEM).model_dump() == validated.model_dump()
+
+
+def test_channel_search_item_matches_validated_model():
+    snippet = CHANNEL_SEARCH_ITEM['snippet']
+    validated = ChannelInfo(
+        channel_id=CHANNEL_SEARCH_ITEM['id']['channelId'],
+        channel_title=snippet['title'],
+        description=snippet['description'],
+        published_at=snippet['publishedAt'],
+    )
+
+    assert _parse_channel_search_item(CHANNEL_SEARCH_ITEM).model_dump() == validated.model_dump()
+
+
+def test_playlist_search_item_matches_validated_model():
+    snippet = PLAYLIST_SEARCH_ITEM['snippet']
+    validated = PlaylistInfo(
+        playlist_id=PLAYLIST_SEARCH_ITEM['id']['playlistId'],
+        playlist_title=snippet['title'],
+        channel_id=snippet['channelId'],
+        description=snippet['description'],
+        published_at=snippet['publishedAt'],
+    )
+
+    assert _parse_playlist_search_item(PLAYLIST_SEARCH_ITEM).model_dump() == validated.model_dump()
+
+
+def test_dumps_matches_pydantic_serializer():
+    videos = [_parse_video_details(VIDEO_DETAILS_ITEM), _parse_video_search_item(VIDEO_SEARCH_ITEM)]
+    results = VideoResults.model_construct(total_results=len(videos), videos=videos)
+
+    assert _dumps(results) == results.model_dump_json(exclude_none=True)
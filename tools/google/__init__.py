@@ -1 +1,17 @@
-from .youtube_tools import YouTubeTool, download_transcript
+""" Google API tools. Submodules are imported on first attribute access (PEP 562). """
+import importlib
+
+_LAZY_ATTRS = {
+    'YouTubeTool': '.youtube_tools',
+    'download_transcript': '.youtube_tools',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
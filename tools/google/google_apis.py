@@ -1,11 +1,22 @@
-import os
+import asyncio
 import logging
-from rich.logging import RichHandler
-from rich.console import Console
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import urllib.request
+from pathlib import Path
+from typing import Callable
+from datetime import datetime, timedelta, timezone
+import httplib2
+import httpx
+import google.auth.transport
+from google.auth.exceptions import RefreshError, TransportError
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
+try:
+    import orjson
+except ImportError:  # optional: googleapiclient falls back to the stdlib json parser
+    orjson = None
 
 logging.getLogger('googleapiclient.discovery').setLevel(logging.ERROR)
 logging.getLogger("openai").setLevel(logging.ERROR)
@@ -15,21 +26,212 @@ def setup_logger(logger_name: str = None):
     if logger_name is None:
         logger_name = __name__
 
+    from rich.console import Console
+    from rich.logging import RichHandler
+
     console = Console()
     logging.basicConfig(
         level=logging.INFO,
         format="%(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(console=console, rich_tracebacks=False)]
+        handlers=[RichHandler(console=console, rich_tracebacks=False, markup=False, show_path=False, show_time=False)]
     )
     logger = logging.getLogger(logger_name)
     return logger
 
 logger = setup_logger('GoogleTool')
 
+# Google APIs only compress responses for clients advertising gzip in the User-Agent
+DEFAULT_HEADERS = {
+    'Accept-Encoding': 'gzip',
+    'User-Agent': 'youtube-search-toolkit (gzip)',
+}
+
+class _HttpxResponse(google.auth.transport.Response):
+    """
+    google-auth view of an `httpx.Response`.
+    """
+    def __init__(self, response: httpx.Response):
+        self._response = response
+
+    @property
+    def status(self):
+        return self._response.status_code
+
+    @property
+    def headers(self):
+        return self._response.headers
+
+    @property
+    def data(self):
+        return self._response.content
+
+class _HttpxAuthRequest(google.auth.transport.Request):
+    """
+    google-auth transport used to refresh credentials over the shared `httpx.Client`.
+    """
+    def __init__(self, client: httpx.Client):
+        self._client = client
+
+    def __call__(self, url, method='GET', body=None, headers=None, timeout=None, **kwargs):
+        try:
+            response = self._client.request(method, url, content=body, headers=headers, timeout=timeout or self._client.timeout)
+        except httpx.HTTPError as e:
+            raise TransportError(e) from e
+        return _HttpxResponse(response)
+
+class SessionHttp:
+    """
+    httplib2-compatible transport backed by a pooled HTTP/2 `httpx.Client`.
+
+    googleapiclient only needs an object with an httplib2-style `request` method.
+    Routing it through httpx keeps connections alive across calls, multiplexes
+    concurrent requests over a single HTTP/2 connection and, unlike `httplib2.Http`,
+    is safe to share between worker threads.
+    """
+    def __init__(self, credentials, max_connections: int = 20, max_keepalive_connections: int = 10, timeout: float = 60,
+                 on_refresh: Callable[[Credentials], None] | None = None):
+        self.credentials = credentials
+        self.on_refresh = on_refresh
+        self.client = httpx.Client(
+            http2=True,
+            timeout=timeout,
+            follow_redirects=True,
+            headers=DEFAULT_HEADERS,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+        )
+        self._auth_request = _HttpxAuthRequest(self.client)
+        self._auth_lock = threading.Lock()
+
+    def request(self, uri, method='GET', body=None, headers=None, redirections=5, connection_type=None):
+        """
+        Perform an authorized HTTP request and return an `(httplib2.Response, bytes)` pair.
+
+        Credentials are refreshed before the request when expired, and once more if the
+        API still answers 401. `on_refresh` is called with the credentials after either refresh.
+        """
+        for attempt in range(2):
+            request_headers = dict(headers or {})
+            with self._auth_lock:
+                token = self.credentials.token
+                if attempt:
+                    self.credentials.refresh(self._auth_request)
+                self.credentials.before_request(self._auth_request, method, uri, request_headers)
+                if self.on_refresh is not None and self.credentials.token != token:
+                    self.on_refresh(self.credentials)
+
+            response = self.client.request(method, uri, content=body, headers=request_headers)
+            if response.status_code != 401:
+                break
+
+        info = dict(response.headers)
+        info['status'] = str(response.status_code)
+        info['reason'] = response.reason_phrase
+        return httplib2.Response(info), response.content
+
+    def close(self):
+        """
+        Close pooled connections.
+        """
+        self.client.close()
+
+DISCOVERY_URL = 'https://www.googleapis.com/discovery/v1/apis/{api}/{apiVersion}/rest'
+
+_token_dir_ready = False
+# Loads discovery documents while credentials are being read or refreshed
+_discovery_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='discovery')
+# Transports of memoized services; one pooled connection set per service for the whole process
+_transports: list[SessionHttp] = []
+
+# Credentials per account (client secret and token prefix), shared by services of different
+# APIs whose scopes they cover, with the token files they are persisted to
+_TOKEN_CACHE: dict[tuple, tuple[Credentials, set[Path]]] = {}
+_token_cache_lock = threading.Lock()
+TOKEN_REFRESH_MARGIN = timedelta(seconds=60)
+
+def _needs_refresh(creds: Credentials) -> bool:
+    """
+    Return True if the credentials are invalid or expire within `TOKEN_REFRESH_MARGIN`.
+    """
+    if not creds.valid:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now < TOKEN_REFRESH_MARGIN
+
+def _write_token(token_path: Path, token_json: str):
+    """
+    Persist serialized credentials to disk.
+    """
+    token_path.write_text(token_json)
+    logger.info("Saved credentials to %s", token_path.name)
+
+def _persist_refreshed_token(token_paths: set[Path], creds: Credentials):
+    """
+    Write credentials refreshed by a `SessionHttp` to every token file they were loaded for.
+    """
+    with _token_cache_lock:
+        paths = sorted(token_paths)
+    token_json = creds.to_json()
+    for token_path in paths:
+        _write_token(token_path, token_json)
+
+def _load_discovery_document(api_name: str, api_version: str, cache_dir: Path) -> str:
+    """
+    Return the discovery document for an API as a JSON string.
+
+    Uses the document bundled with googleapiclient when one exists. Other APIs are
+    fetched once and cached as `discovery_{api_name}_{api_version}.json` in `cache_dir`.
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+
+    document = get_static_doc(api_name, api_version)
+    if document is not None:
+        return document
+
+    cache_path = cache_dir / f'discovery_{api_name}_{api_version}.json'
+    try:
+        return cache_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        pass
+
+    logger.info("Fetching discovery document for %s %s", api_name, api_version)
+    with urllib.request.urlopen(DISCOVERY_URL.format(api=api_name, apiVersion=api_version), timeout=60) as response:
+        document = response.read().decode('utf-8')
+    cache_path.write_text(document, encoding='utf-8')
+    return document
+
+def _orjson_model(data_wrapper: bool):
+    """
+    Build a googleapiclient JsonModel that parses response bodies with orjson.
+
+    orjson parses the raw bytes in one pass, skipping the utf-8 decode and the stdlib parser.
+    The model is used for batched sub-responses too.
+    """
+    from googleapiclient.model import JsonModel
+
+    class OrjsonModel(JsonModel):
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return super().deserialize(content)
+            if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+                body = body['data']
+            return body
+
+    return OrjsonModel(data_wrapper=data_wrapper)
+
 def create_service(client_secret_file, api_name, api_version, *scopes, prefix=''):
     """
     Create a Google API service instance.
+
+    Services are memoized per client secret, API, version, scopes and prefix, so
+    repeated calls reuse the authenticated service instead of re-reading the token
+    file and rebuilding the resource. Expired credentials are refreshed by the
+    service's transport on the next request.
     
     Args:
         client_secret_file: Path to the client secret JSON file
@@ -41,44 +243,145 @@ def create_service(client_secret_file, api_name, api_version, *scopes, prefix=''
     Returns:
         Google API service instance or None if creation failed
     """
+    try:
+        return _create_service(client_secret_file, api_name, api_version, tuple(scopes[0]), prefix)
+    except _ServiceBuildError:
+        # lru_cache doesn't memoize exceptions, so only this key is retried on the next call
+        return None
+
+def close_services():
+    """
+    Close the pooled connections of every service created so far and forget the
+    memoized services, so the next `create_service` call starts fresh.
+    """
+    _create_service.cache_clear()
+    while _transports:
+        _transports.pop().close()
+
+async def create_service_async(client_secret_file, api_name, api_version, *scopes, prefix=''):
+    """
+    Create a Google API service instance without blocking the event loop.
+
+    Runs `create_service` in a worker thread, so several services can be created
+    concurrently with `asyncio.gather`.
+
+    Args:
+        client_secret_file: Path to the client secret JSON file
+        api_name: Name of the API service
+        api_version: Version of the API
+        scopes: Authorization scopes required by the API
+        prefix: Optional prefix for token filename
+
+    Returns:
+        Google API service instance or None if creation failed
+    """
+    return await asyncio.to_thread(create_service, client_secret_file, api_name, api_version, *scopes, prefix=prefix)
+
+class _ServiceBuildError(Exception):
+    """
+    Raised by `_create_service` when the service could not be built from valid credentials.
+    """
+
+@functools.lru_cache(maxsize=8)
+def _create_service(client_secret_file, api_name, api_version, scopes, prefix):
+    """
+    Uncached implementation of `create_service`. `scopes` must be a tuple so the
+    arguments are hashable.
+    """
+    global _token_dir_ready
+
     CLIENT_SECRET_FILE = client_secret_file
     API_SERVICE_NAME = api_name
     API_VERSION = api_version
-    SCOPES = [scope for scope in scopes[0]]
+    SCOPES = list(scopes)
     
     creds = None
-    working_dir = os.getcwd()
-    token_dir = 'token files'
-    token_file = f'token_{API_SERVICE_NAME}_{API_VERSION}{prefix}.json'
+    token_path = Path.cwd() / 'token files' / f'token_{API_SERVICE_NAME}_{API_VERSION}{prefix}.json'
+    token_dir = token_path.parent
 
-    if not os.path.exists(os.path.join(working_dir, token_dir)):
-        os.mkdir(os.path.join(working_dir, token_dir))
-        logger.info(f"Created token directory: {token_dir}")
+    if not _token_dir_ready:
+        try:
+            token_dir.mkdir()
+            logger.info("Created token directory: %s", token_dir.name)
+        except FileExistsError:
+            pass
+        _token_dir_ready = True
 
-    if os.path.exists(os.path.join(working_dir, token_dir, token_file)):
-        creds = Credentials.from_authorized_user_file(os.path.join(working_dir, token_dir, token_file), SCOPES)
-        logger.debug(f"Loaded existing credentials from {token_file}")
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            logger.info("Refreshing expired credentials")
-            creds.refresh(Request())
+    # Independent of the credentials, so start it before the token read/refresh
+    document_future = _discovery_executor.submit(_load_discovery_document, API_SERVICE_NAME, API_VERSION, token_dir)
+
+    account_key = (CLIENT_SECRET_FILE, prefix)
+
+    with _token_cache_lock:
+        creds, token_paths = _TOKEN_CACHE.get(account_key, (None, set()))
+        save_token = False
+
+        if creds is not None and not creds.has_scopes(SCOPES):
+            # Another API's credentials for this account; fall back to this API's token file
+            creds = None
+
+        if creds is None:
+            token_paths = set()
+            try:
+                # Load with the token's own scopes so a mismatch can be detected up front
+                creds = Credentials.from_authorized_user_file(token_path)
+                logger.debug("Loaded existing credentials from %s", token_path.name)
+            except FileNotFoundError:
+                pass
+
+            if creds and not creds.has_scopes(SCOPES):
+                logger.info("Stored credentials are missing required scopes, re-authenticating")
+                creds = None
+
+            if not creds or _needs_refresh(creds):
+                if creds and creds.refresh_token:
+                    logger.info("Refreshing expired credentials")
+                    try:
+                        creds.refresh(Request())
+                    except RefreshError as e:
+                        # Revoked or expired refresh token: the stored token can't be used again
+                        logger.warning("Failed to refresh credentials (%s), removing invalid token file: %s", e, token_path.name)
+                        token_path.unlink(missing_ok=True)
+                        creds = None
+
+                if not creds or not creds.refresh_token:
+                    logger.info("Obtaining new credentials")
+                    # Only needed for the interactive flow; skip the import when a token is cached
+                    from google_auth_oauthlib.flow import InstalledAppFlow
+                    flow = InstalledAppFlow.from_client_secrets_file(CLIENT_SECRET_FILE, SCOPES)
+                    creds = flow.run_local_server(port=0)
+                save_token = True
         else:
-            logger.info("Obtaining new credentials")
-            flow = InstalledAppFlow.from_client_secrets_file(CLIENT_SECRET_FILE, SCOPES)
-            creds = flow.run_local_server(port=0)
+            # Cached credentials are refreshed by the transports sharing them; only write
+            # this API's token file if it doesn't hold them yet
+            save_token = token_path not in token_paths
+
+        if save_token:
+            # Persist in the background so the token write doesn't block service creation
+            threading.Thread(target=_write_token, args=(token_path, creds.to_json())).start()
+
+        token_paths.add(token_path)
+        _TOKEN_CACHE[account_key] = (creds, token_paths)
 
-        with open(os.path.join(working_dir, token_dir, token_file), 'w') as token:
-            token.write(creds.to_json())
-            logger.info(f"Saved credentials to {token_file}")
+    from googleapiclient.discovery import build_from_document
+
+    # Outside the try below: a missing HTTP/2 dependency (h2) is an install problem, not a bad token
+    http = SessionHttp(creds, on_refresh=functools.partial(_persist_refreshed_token, token_paths))
 
     try:
-        service = build(API_SERVICE_NAME, API_VERSION, credentials=creds, static_discovery=False)
-        logger.info(f"{API_SERVICE_NAME} {API_VERSION} service created successfully")
+        document = document_future.result()
+        model = None
+        if orjson is not None:
+            # The parsed document also tells whether responses are wrapped in a `data` field
+            document = orjson.loads(document)
+            model = _orjson_model('dataWrapper' in document.get('features', []))
+        service = build_from_document(document, http=http, model=model)
+        _transports.append(http)
+        logger.info("%s %s service created successfully", API_SERVICE_NAME, API_VERSION)
         return service
     except Exception as e:
-        logger.error(f"Failed to create service instance for {API_SERVICE_NAME}")
+        # Discovery and build failures don't involve the credentials, so the token file is kept
+        logger.error("Failed to create service instance for %s", API_SERVICE_NAME)
         logger.exception(e)
-        os.remove(os.path.join(working_dir, token_dir, token_file))
-        logger.warning(f"Removed invalid token file: {token_file}")
-        return None
+        http.close()
+        raise _ServiceBuildError(f"Failed to create service instance for {API_SERVICE_NAME}") from e
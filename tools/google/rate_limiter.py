@@ -0,0 +1,61 @@
+""" Rate limiting helpers for Google API clients """
+import time
+import threading
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`, so short bursts
+    go through immediately and callers only sleep once the bucket is empty. The rate
+    adapts to the server: `penalize` halves it after a rate limit error and `reward`
+    grows it back towards the configured rate after each successful request.
+    """
+    def __init__(self, rate: float, capacity: int, min_rate: float = 0.05) -> None:
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self, cost: int = 1) -> None:
+        """
+        Block until `cost` tokens are available, then consume them.
+
+        Args:
+            cost: Number of tokens the request consumes.
+        """
+        cost = min(cost, self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= cost:
+                    self._tokens -= cost
+                    return
+                wait = (cost - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self) -> None:
+        """
+        Halve the refill rate after the server reported a rate limit.
+        """
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def reward(self) -> None:
+        """
+        Grow the refill rate back towards its configured value after a successful request.
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill()
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
@@ -0,0 +1,73 @@
+""" Response caching helpers for Google API clients """
+import time
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of API responses with a time to live per entry.
+
+    Every entry records when it was generated and when it goes stale. `get` only returns
+    fresh entries, but stale ones stay around until they are evicted so `get_stale` can
+    still serve them when the API fails.
+    """
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> dict | None:
+        """
+        Return the cached response for `key` if it is still fresh.
+
+        Args:
+            key: The cache key of the request.
+
+        Returns:
+            dict: The cached response, or None on a miss or a stale entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def get_stale(self, key: Hashable) -> dict | None:
+        """
+        Return the cached response for `key` regardless of its age.
+
+        Args:
+            key: The cache key of the request.
+
+        Returns:
+            dict: The cached response, or None if the key was never cached or has been evicted.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[2] if entry is not None else None
+
+    def set(self, key: Hashable, response: dict, ttl: float) -> None:
+        """
+        Cache a response for `ttl` seconds, evicting the least recently used entries beyond `maxsize`.
+
+        Args:
+            key: The cache key of the request.
+            response: The parsed API response.
+            ttl: Number of seconds the response stays fresh.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now, now + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop every cached response.
+        """
+        with self._lock:
+            self._entries.clear()
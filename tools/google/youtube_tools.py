@@ -1,14 +1,71 @@
 """ YouTube Tools based on Google YouTube Data API """
+import io
 import re
 import time
-from googleapiclient.discovery import Resource
-from pydantic import BaseModel, Field
-from youtube_transcript_api import YouTubeTranscriptApi
+import random
+import functools
+import itertools
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator
+from googleapiclient.errors import HttpError
+from pydantic import BaseModel, ConfigDict, Field
+try:
+    import orjson
+except ImportError:  # optional: fall back to pydantic's serializer
+    orjson = None
 from tools.google.google_apis import setup_logger, create_service
+from tools.google.rate_limiter import RateLimiter
+from tools.google.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from googleapiclient.discovery import Resource
 
 logger = setup_logger('YouTubeTool')
 
+RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded', 'servingLimitExceeded')
+VIDEO_DETAIL_PARTS = 'id,snippet,contentDetails,statistics,paidProductPlacementDetails,topicDetails'
+MAX_IDS_PER_REQUEST = 50
+MAX_PAGE_SIZE = 50
+
+# Partial responses: only request the JSON keys that are parsed into the models below
+PAGE_FIELDS = 'nextPageToken,pageInfo/totalResults'
+CHANNEL_INFO_FIELDS = 'items(id,snippet(title,description,publishedAt,country),statistics(viewCount,subscriberCount,videoCount))'
+CHANNEL_SEARCH_FIELDS = f'{PAGE_FIELDS},items(id/channelId,snippet(title,description,publishedAt))'
+PLAYLIST_SEARCH_FIELDS = f'{PAGE_FIELDS},items(id/playlistId,snippet(title,channelId,description,publishedAt))'
+VIDEO_SEARCH_FIELDS = f'{PAGE_FIELDS},items(id/videoId,snippet(channelId,channelTitle,title,description,publishTime))'
+VIDEO_DETAIL_FIELDS = (
+    f'{PAGE_FIELDS},items(id,snippet(channelId,channelTitle,title,description,publishedAt,tags),'
+    'contentDetails(duration,dimension),statistics(viewCount,likeCount,commentCount),'
+    'topicDetails/topicCategories,paidProductPlacementDetails/hasPaidProductPlacement)'
+)
+UPLOADS_PLAYLIST_FIELDS = 'items(id,contentDetails/relatedPlaylists/uploads)'
+PLAYLIST_ITEM_FIELDS = f'{PAGE_FIELDS},items/snippet(channelId,channelTitle,title,description,publishedAt,resourceId/videoId)'
+MAX_BATCH_SIZE = 100
+
+# Seconds a cached response stays fresh, per API method: search results move fast,
+# channel details barely change and video statistics sit in between
+CACHE_TTLS = {
+    'youtube.search.list': 10,
+    'youtube.channels.list': 24 * 60 * 60,
+    'youtube.videos.list': 5 * 60,
+    'youtube.playlistItems.list': 5 * 60,
+}
+DEFAULT_CACHE_TTL = 60
+# Transcripts rarely change once published
+TRANSCRIPT_CACHE_TTL = 7 * 24 * 60 * 60
+
+# A watch/short URL (anything may follow the ID, e.g. `&t=10s`) or a bare 11-character ID
+VIDEO_ID_PATTERN = re.compile(
+    r'(?:https?://)?(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})'
+    r'|([a-zA-Z0-9_-]{11})$'
+)
+
 class PlaylistInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     playlist_id: str = Field(..., description='Playlist ID')
     playlist_title: str = Field(..., description='Playlist Title')
     channel_id: str = Field(..., description='Channel ID')
@@ -16,10 +73,14 @@ class PlaylistInfo(BaseModel):
     published_at: str = Field(..., description='Playlist Published Time')
 
 class PlaylistResults(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     total_results: int = Field(..., description='Total number of results')
     playlists: list[PlaylistInfo] = Field(..., description='Playlist Information')
 
 class ChannelInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     channel_id: str = Field(..., description='Channel ID')
     channel_title: str = Field(..., description='Channel Title')
     description: str = Field(..., description='Channel Description')
@@ -30,10 +91,14 @@ class ChannelInfo(BaseModel):
     video_count: int = Field(None, description='Video Count')
 
 class ChannelResults(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     total_results: int = Field(..., description='Total number of results')
     channels: list[ChannelInfo] = Field(..., description='Channel Information')
 
 class VideoInfo(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     channel_id: str = Field(..., description='Channel ID')
     channel_title: str = Field(..., description='Channel Title')
     video_id: str = Field(..., description='Video ID')
@@ -52,10 +117,31 @@ class VideoInfo(BaseModel):
     has_paid_product_placement: bool = Field(None, description='Has Paid Product Placement')
 
 class VideoResults(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     total_results: int = Field(..., description='Total number of results')
     videos: list[VideoInfo] = Field(..., description='Video Information')
 
 
+def _encode_model(obj):
+    """
+    orjson `default` hook: encode a model straight from its field values.
+
+    The result models are plain records without custom serializers, so their `__dict__`
+    (in field order) is exactly what `model_dump(exclude_none=True)` would build.
+    """
+    if isinstance(obj, BaseModel):
+        return {name: value for name, value in obj.__dict__.items() if value is not None}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dumps(model: BaseModel) -> str:
+    """
+    Serialize a result model to a JSON string, through orjson when it is installed. Unset (None) fields are left out.
+    """
+    if orjson is None:
+        return model.model_dump_json(exclude_none=True)
+    return orjson.dumps(model, default=_encode_model).decode()
+
 def extract_video_id(input_str: str) -> str | None:
     """
     Extract YouTube video ID from a URL or ID string.
@@ -66,19 +152,174 @@ def extract_video_id(input_str: str) -> str | None:
     Returns:
         str: Extracted YouTube video ID.
     """
-    url_pattern = re.compile(
-        r'(?:https?://)?(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})'
+    match = VIDEO_ID_PATTERN.match(input_str)
+    if match:
+        return match.group(1) or match.group(2)
+
+    return None
+
+def is_rate_limit_error(error: HttpError) -> bool:
+    """
+    Check whether an API error is a transient rate limit rather than an exhausted quota.
+
+    Args:
+        error: The HttpError raised by the API client.
+
+    Returns:
+        bool: True if the request can be retried after backing off.
+    """
+    if error.resp.status == 429:
+        return True
+    if error.resp.status != 403:
+        return False
+    details = error.error_details if isinstance(error.error_details, list) else []
+    return any(detail.get('reason') in RATE_LIMIT_REASONS for detail in details)
+
+def _cache_key(request) -> tuple:
+    """
+    Identify a request by its API method and full URI, which carries every query parameter.
+
+    For searches the `q` parameter is normalized in the key only, the request itself is
+    sent with the query exactly as given.
+    """
+    if request.methodId != 'youtube.search.list':
+        return request.methodId, request.uri
+
+    url = urlsplit(request.uri)
+    params = tuple(sorted(
+        (name, _normalize_query(value) if name == 'q' else value)
+        for name, value in parse_qsl(url.query, keep_blank_values=True)
+    ))
+    return request.methodId, url.path, params
+
+def _normalize_query(query: str) -> str:
+    """
+    Canonicalize a free-text search query for the response cache key.
+
+    Repeated whitespace and letter case don't change YouTube results, except for the
+    upper-case `OR` operator, which is kept as is. `lower()` is used rather than
+    `casefold()` so letters such as "ß" aren't rewritten.
+    """
+    return ' '.join(term if term == 'OR' else term.lower() for term in query.split())
+
+def _to_int(value: str | None) -> int | None:
+    """
+    Convert a count returned as a string by the API, which `model_construct` would otherwise keep as-is.
+    """
+    return int(value) if value is not None else None
+
+def _parse_video_details(item: dict) -> VideoInfo:
+    """
+    Build a VideoInfo from a `videos().list` item fetched with `VIDEO_DETAIL_PARTS`.
+    """
+    snippet = item['snippet']
+    content_details = item.get('contentDetails', {})
+    statistics = item.get('statistics', {})
+    topic_details = item.get('topicDetails', {})
+    paid_product_placement = item.get('paidProductPlacementDetails', {})
+
+    return VideoInfo.model_construct(
+        channel_id=snippet['channelId'],
+        channel_title=snippet['channelTitle'],
+        video_id=item['id'],
+        video_title=snippet['title'],
+        description=snippet.get('description', ''),
+        published_at=snippet['publishedAt'],
+        tags=snippet.get('tags', []),
+        duration=content_details.get('duration'),
+        dimension=content_details.get('dimension'),
+        view_count=_to_int(statistics.get('viewCount')),
+        like_count=_to_int(statistics.get('likeCount', 0)),
+        comment_count=_to_int(statistics.get('commentCount', 0)),
+        topic_categories=topic_details.get('topicCategories', []),
+        has_paid_product_placement=paid_product_placement.get('hasPaidProductPlacement', False)
     )
-    match = url_pattern.match(input_str)
 
-    if match:
-        return match.group(1)
+def _search_params(query: str, fields: str, published_after: str, published_before: str, region_code: str, order: str, **extra) -> dict:
+    """
+    Map the arguments shared by the `search_*` methods onto `search().list` parameters.
+    """
+    return {
+        'q': query,
+        'fields': fields,
+        'order': order,
+        'publishedAfter': published_after,
+        'publishedBefore': published_before,
+        'regionCode': region_code,
+        **extra,
+    }
+
+def _parse_channel_search_item(item: dict) -> ChannelInfo:
+    """
+    Build a ChannelInfo from a `search().list` item of type channel.
+    """
+    snippet = item['snippet']
 
-    id_pattern = re.compile(r'^[a-zA-Z0-9_-]{11}$')
-    if id_pattern.match(input_str):
-        return input_str
+    return ChannelInfo.model_construct(
+        channel_id=item['id'].get('channelId'),
+        channel_title=snippet.get('title'),
+        description=snippet.get('description'),
+        published_at=snippet.get('publishedAt')
+    )
 
-    return None
+def _parse_playlist_search_item(item: dict) -> PlaylistInfo:
+    """
+    Build a PlaylistInfo from a `search().list` item of type playlist.
+    """
+    snippet = item['snippet']
+
+    return PlaylistInfo.model_construct(
+        playlist_id=item['id'].get('playlistId'),
+        playlist_title=snippet.get('title'),
+        channel_id=snippet.get('channelId'),
+        description=snippet.get('description'),
+        published_at=snippet.get('publishedAt')
+    )
+
+def _parse_video_search_item(item: dict) -> VideoInfo:
+    """
+    Build a VideoInfo from a `search().list` item of type video.
+    """
+    snippet = item['snippet']
+
+    return VideoInfo.model_construct(
+        channel_id=snippet.get('channelId'),
+        channel_title=snippet.get('channelTitle'),
+        video_id=item['id'].get('videoId'),
+        video_title=snippet.get('title'),
+        description=snippet.get('description'),
+        published_at=snippet.get('publishTime')
+    )
+
+def _parse_playlist_item_video(item: dict) -> VideoInfo:
+    """
+    Build a VideoInfo from a `playlistItems().list` item fetched with the `snippet` part.
+    """
+    snippet = item['snippet']
+
+    return VideoInfo.model_construct(
+        channel_id=snippet['channelId'],
+        channel_title=snippet['channelTitle'],
+        video_id=snippet['resourceId']['videoId'],
+        video_title=snippet['title'],
+        description=snippet.get('description', ''),
+        published_at=snippet['publishedAt'],
+    )
+
+_transcript_cache = ResponseCache(maxsize=128)
+
+@functools.lru_cache(maxsize=1)
+def _transcript_api():
+    """
+    Return a YouTubeTranscriptApi whose requests session, and so its pooled keep-alive connections, is shared by every call.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from youtube_transcript_api import YouTubeTranscriptApi
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20))
+    return YouTubeTranscriptApi(http_client=session)
 
 def download_transcript(video_id: str, include_timestamp: bool = False) -> str:
     """
@@ -86,6 +327,7 @@ def download_transcript(video_id: str, include_timestamp: bool = False) -> str:
 
     Args:
         video_id: YouTube video ID or URL.
+        include_timestamp: Prefix every transcript line with its start time in seconds.
 
     Returns:
         str: Transcript text of the video.
@@ -94,18 +336,27 @@ def download_transcript(video_id: str, include_timestamp: bool = False) -> str:
     if not video_id:
         return 'Invalid YouTube video ID or URL.'
     
-    logger.info(f"Downloading transcript for video ID: {video_id}")
-    logger.debug(f"Include timestamp: {include_timestamp}")
+    logger.info("Downloading transcript for video ID: %s", video_id)
+    logger.debug("Include timestamp: %s", include_timestamp)
 
     try:
-        if include_timestamp:
-            transcript = YouTubeTranscriptApi.get_transcript(video_id)
-            transcript_text = str(transcript)
+        cached = _transcript_cache.get(video_id)
+        if cached is not None:
+            logger.debug("Serving transcript for %s from the transcript cache", video_id)
+            transcript = cached['segments']
         else:
-            transcript = YouTubeTranscriptApi.get_transcript(video_id)
-            transcript_text = '\n'.join([entry['text'] for entry in transcript])
-
-        return transcript_text
+            # fetch() lists the available transcripts and fetches the preferred one
+            transcript = _transcript_api().fetch(video_id).to_raw_data()
+            _transcript_cache.set(video_id, {'segments': transcript}, TRANSCRIPT_CACHE_TTL)
+
+        if not include_timestamp:
+            return '\n'.join(entry['text'] for entry in transcript)
+
+        # One "[start] text" line per segment, written without an intermediate list
+        buffer = io.StringIO()
+        for entry in transcript:
+            buffer.write(f"[{entry['start']:.1f}] {entry['text']}\n")
+        return buffer.getvalue()
     except Exception as e:
         return f'Error downloading transcript: {str(e)}'
 
@@ -119,11 +370,34 @@ class YouTubeTool:
     API_NAME = 'youtube'
     API_VERSION = 'v3'
     SCOPES = ['https://www.googleapis.com/auth/youtube.readonly']
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 1.0
+    MAX_PREFETCHED_VIDEOS = 500
+    MAX_CONCURRENT_REQUESTS = 8
 
-    def __init__(self, client_secret: str) -> None:
+    def __init__(self, client_secret: str, prefetch_video_details: bool = True, cache_fallback: bool = True) -> None:
         logger.info("Initializing YouTubeTool")
         self.client_secret = client_secret
-        self._init_youtube_service()
+        # Details for videos returned by a search are fetched speculatively in the background,
+        # so a follow-up details request is often ready before the model finishes decoding it
+        self.prefetch_video_details = prefetch_video_details
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='youtube-prefetch')
+        # Video ID -> (time the prefetch started, future); entries expire with the videos().list cache TTL
+        self._prefetched_videos: dict[str, tuple[float, Future]] = {}
+        self._prefetch_lock = threading.Lock()
+        # Fetches the next page of a paginated listing while the current one is parsed
+        self._page_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='youtube-pages')
+        # A channel's uploads playlist never changes, so it is resolved once per channel
+        self._uploads_playlist_cache: dict[str, str] = {}
+        # Idempotent reads are cached per request; with `cache_fallback` a stale response
+        # is served when the API fails rather than surfacing the error
+        self._response_cache = ResponseCache(maxsize=1024)
+        self.cache_fallback = cache_fallback
+        # 100 requests per 100 seconds, with bursts of up to 10
+        self._rate_limiter = RateLimiter(rate=1.0, capacity=10)
+        # The service (and the OAuth flow behind it) is created on first use
+        self._service = None
+        self._service_lock = threading.Lock()
         logger.info("YouTubeTool initialized successfully")
 
     def _init_youtube_service(self):
@@ -131,56 +405,277 @@ class YouTubeTool:
         Initialize the YouTube Data API service.
         """
         logger.info("Initializing YouTube Data API service")
-        self.service = create_service(
+        self._service = create_service(
             self.client_secret,
             self.API_NAME,
             self.API_VERSION,
             self.SCOPES
         )
-        logger.debug(f"YouTube service created: {self.service is not None}")
+        logger.debug("YouTube service created: %s", self._service is not None)
 
     @property
-    def youtube_service(self) -> Resource:
+    def service(self) -> 'Resource':
+        """
+        Return the YouTube Data API service, creating it on first access.
+        """
+        if self._service is None:
+            with self._service_lock:
+                if self._service is None:
+                    self._init_youtube_service()
+        return self._service
+
+    @property
+    def youtube_service(self) -> 'Resource':
         """
         Return YouTube Data API service instance.
         """
         logger.debug("Accessing youtube_service property")
         return self.service
 
-    def get_channel_info(self, channel_id: str) -> ChannelInfo:
+    def _stale_or_raise(self, key: tuple, error: Exception, use_cache: bool = True) -> dict:
+        """
+        Return the stale cached response for `key` when `cache_fallback` is enabled, otherwise re-raise `error`.
+
+        Callers that opted out of the cache (`use_cache=False`) always get the error.
+        """
+        stale = self._response_cache.get_stale(key) if use_cache and self.cache_fallback else None
+        if stale is None:
+            raise error
+        logger.warning("YouTube API request failed (%s), serving a stale cached response", error)
+        return stale
+
+    def _execute(self, request, use_cache: bool = True) -> dict:
+        """
+        Execute an API request through the response cache and the rate limiter, backing off exponentially on rate limit errors.
+
+        Args:
+            request: The googleapiclient HttpRequest to execute.
+            use_cache: Serve a fresh cached response if there is one, cache the response and fall back to a stale one on errors. False bypasses the cache entirely.
+
+        Returns:
+            dict: The parsed API response.
+        """
+        key = _cache_key(request)
+        if use_cache:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                logger.debug("Serving %s from the response cache", request.methodId)
+                return cached
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            self._rate_limiter.acquire()
+            try:
+                response = request.execute()
+            except HttpError as e:
+                if attempt == self.MAX_RETRIES or not is_rate_limit_error(e):
+                    return self._stale_or_raise(key, e, use_cache)
+                self._rate_limiter.penalize()
+                delay = self.BACKOFF_BASE * 2 ** attempt + random.uniform(0, 1)
+                logger.warning("Rate limited by the YouTube API, retrying in %.1fs", delay)
+                time.sleep(delay)
+            else:
+                self._rate_limiter.reward()
+                if use_cache:
+                    self._response_cache.set(key, response, CACHE_TTLS.get(request.methodId, DEFAULT_CACHE_TTL))
+                return response
+
+    def _execute_batch(self, request_factories: dict[str, Callable], use_cache: bool = True) -> dict[str, dict]:
+        """
+        Execute requests through Google API batch HTTP calls, retrying rate limited sub-requests with exponential backoff.
+
+        Args:
+            request_factories: Maps a request ID to a callable building the sub-request, so failed sub-requests can be rebuilt for a retry.
+            use_cache: Serve fresh cached responses without sending their sub-requests, cache the responses and fall back to stale ones on errors. False bypasses the cache entirely.
+
+        Returns:
+            dict: Responses keyed by request ID.
+        """
+        keys = {request_id: _cache_key(factory()) for request_id, factory in request_factories.items()}
+        responses = {}
+        if use_cache:
+            for request_id, key in keys.items():
+                cached = self._response_cache.get(key)
+                if cached is not None:
+                    responses[request_id] = cached
+            if responses:
+                logger.debug("Serving %d batched sub-requests from the response cache", len(responses))
+        pending = {request_id: factory for request_id, factory in request_factories.items() if request_id not in responses}
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            failed = {}
+
+            def collect(request_id, response, exception):
+                if exception is None:
+                    responses[request_id] = response
+                    if use_cache:
+                        method_id = keys[request_id][0]
+                        self._response_cache.set(keys[request_id], response, CACHE_TTLS.get(method_id, DEFAULT_CACHE_TTL))
+                else:
+                    failed[request_id] = exception
+
+            request_ids = list(pending)
+            for start in range(0, len(request_ids), MAX_BATCH_SIZE):
+                batch_ids = request_ids[start:start + MAX_BATCH_SIZE]
+                batch = self.service.new_batch_http_request(callback=collect)
+                for request_id in batch_ids:
+                    self._rate_limiter.acquire()
+                    batch.add(pending[request_id](), request_id=request_id)
+                logger.debug("Executing batch request with %d sub-requests", len(batch_ids))
+                batch.execute()
+
+            retryable = {
+                request_id: error for request_id, error in failed.items()
+                if isinstance(error, HttpError) and is_rate_limit_error(error)
+            }
+            if retryable:
+                self._rate_limiter.penalize()
+            for request_id, error in failed.items():
+                if request_id not in retryable:
+                    responses[request_id] = self._stale_or_raise(keys[request_id], error, use_cache)
+            if not retryable:
+                break
+            if attempt == self.MAX_RETRIES:
+                for request_id, error in retryable.items():
+                    responses[request_id] = self._stale_or_raise(keys[request_id], error, use_cache)
+                break
+
+            pending = {request_id: pending[request_id] for request_id in retryable}
+            delay = self.BACKOFF_BASE * 2 ** attempt + random.uniform(0, 1)
+            logger.warning("%d batched sub-requests were rate limited, retrying in %.1fs", len(pending), delay)
+            time.sleep(delay)
+
+        return responses
+
+    def _iter_pages(self, list_method: Callable, page_info: dict, max_results: int | None = None, use_cache: bool = True, **params) -> Iterator[dict]:
+        """
+        Lazily page through the results of a paginated `list()` endpoint, yielding the raw items.
+
+        A page is only requested once the consumer needs it, so stopping early saves the quota
+        and latency of the unconsumed tail. When `max_results` says more items are needed, the
+        next page is fetched in the background while the consumer parses the current one.
+
+        Args:
+            list_method: The resource's `list` method, e.g. `self.service.search().list`.
+            page_info: Updated with the `pageInfo` of every page fetched, e.g. `totalResults`.
+            max_results: Number of items the consumer wants, used to size the last page. None pages until the results run out, without fetching ahead.
+            use_cache: Serve fresh cached pages if there are any.
+            **params: The remaining `list()` parameters.
+
+        Yields:
+            dict: One result item.
+        """
+        def fetch(page_token: str | None, page_size: int) -> dict:
+            logger.debug("Fetching next %s results, page_token: %s", page_size, page_token)
+            request = list_method(maxResults=page_size, pageToken=page_token, **params)
+            return self._execute(request, use_cache)
+
+        count = 0
+        page_size = MAX_PAGE_SIZE if max_results is None else min(MAX_PAGE_SIZE, max_results)
+        future = self._page_executor.submit(fetch, None, page_size)
+
+        while future is not None:
+            response = future.result()
+            items = response.get('items', [])
+            page_info.update(response.get('pageInfo', {}))
+            next_page_token = response.get('nextPageToken')
+            logger.debug("Retrieved %d results, next_page_token: %s", len(items), next_page_token)
+
+            future = None
+            if not next_page_token:
+                logger.debug("No more pages available")
+            elif max_results is not None and count + len(items) < max_results:
+                # The caller is known to need the next page, so it is requested before this one is consumed
+                future = self._page_executor.submit(fetch, next_page_token, min(MAX_PAGE_SIZE, max_results - count - len(items)))
+
+            for item in items:
+                count += 1
+                yield item
+
+            if next_page_token and max_results is None:
+                future = self._page_executor.submit(fetch, next_page_token, MAX_PAGE_SIZE)
+
+    def _iter_search(self, type_: str, page_info: dict, max_results: int | None = None, use_cache: bool = True, **params) -> Iterator[dict]:
+        """
+        Lazily page through `search().list` results of one type, see `_iter_pages`.
+
+        Args:
+            type_: The resource type to search for: 'channel', 'playlist' or 'video'.
+        """
+        return self._iter_pages(self.service.search().list, page_info, max_results, use_cache, part='snippet', type=type_, **params)
+
+    def _paginated_search(self, type_: str, item_builder: Callable[[dict], BaseModel], max_results: int, use_cache: bool = True, **params) -> tuple[list, int]:
+        """
+        Run a search for one resource type, shared by every `search_*` method.
+
+        Args:
+            type_: The resource type to search for: 'channel', 'playlist' or 'video'.
+            item_builder: Builds the result model from one search item.
+            max_results: The maximum number of results to return.
+            use_cache: Serve fresh cached pages if there are any.
+            **params: The remaining `search().list` parameters, see `_search_params`.
+
+        Returns:
+            tuple: The built results and the total number of results reported by the API.
+        """
+        logger.info("Searching for %ss with query: %s, max_results: %s", type_, params.get('q'), max_results)
+        logger.debug("Search parameters: %s", params)
+
+        # A non-positive limit returns nothing, as the old `while len(lst) < max_results` loop did
+        max_results = max(0, max_results)
+        page_info = {}
+        items = self._iter_search(type_, page_info, max_results, use_cache, **params)
+        results = [item_builder(item) for item in itertools.islice(items, max_results)]
+        total_results = page_info.get('totalResults', 0)
+
+        logger.info("%s search completed. Found %s total results, returning %d results", type_.capitalize(), total_results, len(results))
+        return results, total_results
+
+    async def get_channel_info(self, channel_id: str, no_cache: bool = False) -> ChannelInfo:
         """
         Get information about a YouTube channel based on the provided channel ID.
 
         Args:
             channel_id (str): The ID of the YouTube channel.
+            no_cache (bool): Skip the response cache and fetch fresh results. Default is False.
         
         Returns:
             ChannelInfo: Information about the YouTube channel.
         """
-        logger.info(f"Getting channel info for channel_id: {channel_id}")
+        return await asyncio.to_thread(self._get_channel_info, channel_id, no_cache)
+
+    def _get_channel_info(self, channel_id: str, no_cache: bool = False) -> ChannelInfo:
+        """
+        Blocking implementation of `get_channel_info`, run in a worker thread.
+        """
+        logger.info("Getting channel info for channel_id: %s", channel_id)
         request = self.service.channels().list(
             part='snippet,statistics',
-            id=channel_id
+            id=channel_id,
+            fields=CHANNEL_INFO_FIELDS
         )
         logger.debug("Executing channel info request")
-        response = request.execute()
-        logger.debug(f"Channel info response received with {len(response.get('items', []))} items")
+        response = self._execute(request, use_cache=not no_cache)
+        items = response.get('items', [])
+        logger.debug("Channel info response received with %d items", len(items))
 
+        item = items[0]
+        snippet = item['snippet']
+        statistics = item['statistics']
         channel_info = ChannelInfo(
-            channel_id=response['items'][0].get('id'),
-            channel_title=response['items'][0]['snippet'].get('title'),
-            description=response['items'][0]['snippet'].get('description'),
-            published_at=response['items'][0]['snippet'].get('publishedAt'),
-            country=response['items'][0]['snippet'].get('country', ''),
-            view_count=response['items'][0]['statistics'].get('viewCount'),
-            subscriber_count=response['items'][0]['statistics'].get('subscriberCount'),
-            video_count=response['items'][0]['statistics'].get('videoCount')  # use get to avoid KeyError
+            channel_id=item.get('id'),
+            channel_title=snippet.get('title'),
+            description=snippet.get('description'),
+            published_at=snippet.get('publishedAt'),
+            country=snippet.get('country', ''),
+            view_count=statistics.get('viewCount'),
+            subscriber_count=statistics.get('subscriberCount'),
+            video_count=statistics.get('videoCount')  # use get to avoid KeyError
         )
-        logger.info(f"Retrieved channel info for: {channel_info.channel_title}")
-        return channel_info.model_dump_json()
+        logger.info("Retrieved channel info for: %s", channel_info.channel_title)
+        return _dumps(channel_info)
 
     
-    def search_channel(self, channel_name: str,  published_after: str = None, published_before: str = None, region_code: str = 'US', order: str = 'relevance', max_results: int = 50) -> ChannelResults:
+    async def search_channel(self, channel_name: str,  published_after: str = None, published_before: str = None, region_code: str = 'US', order: str = 'relevance', max_results: int = 50, no_cache: bool = False) -> ChannelResults:
         """
         Searches for YouTube channels based on the provided channel name.
         
@@ -191,66 +686,24 @@ class YouTubeTool:
             region_code (str): The regionCode parameter instructs the API to return search results for the specified country. The parameter value is an ISO 3166-1 alpha-2 country code.
             order (str): The order in which to return results. Default is 'relevance'. Options include 'date', 'rating', 'relevance', 'title', 'videoCount', and 'viewCount'.
             max_results (int): The maximum number of results to return. Default is 50.
+            no_cache (bool): Skip the response cache and fetch fresh results. Default is False.
 
         Returns:
             ChannelResults: A list of channels that match the search
         """
-        logger.info(f"Searching for channels with name: {channel_name}, max_results: {max_results}")
-        logger.debug(f"Search parameters: published_after={published_after}, published_before={published_before}, region_code={region_code}, order={order}")
-        
-        lst = []
-        total_results = 0
-        next_page_token = None
-
-        while len(lst) < max_results:
-            current_max = min(50, max_results - len(lst))
-            logger.debug(f"Fetching next {current_max} channel results, current count: {len(lst)}")
-            
-            request = self.service.search().list(
-                part='snippet',
-                q=channel_name,
-                type='channel',
-                maxResults=current_max,
-                order=order,
-                publishedAfter=published_after,
-                publishedBefore=published_before,
-                regionCode=region_code,
-                pageToken=next_page_token
-            )
-            response = request.execute()
-
-            time.sleep(1)  # Rate limit to avoid hitting API limits
-
-            logger.debug(f"Channel search response received with {len(response.get('items', []))} items")
-
-            for item in response['items']:
-                channel_id = item['id'].get('channelId')
-                channel_title = item['snippet'].get('title')
-                channel_description = item['snippet'].get('description')
-                channel_published_at = item['snippet'].get('publishedAt')
-                channel_info = ChannelInfo(
-                    channel_id=channel_id,
-                    channel_title=channel_title,
-                    description=channel_description,
-                    published_at=channel_published_at
-                )
-                lst.append(channel_info)
-
-            total_results = response['pageInfo']['totalResults']
-            next_page_token = response.get('nextPageToken')
-            logger.debug(f"Retrieved {len(response.get('items', []))} channels, next_page_token: {next_page_token}")
+        return await asyncio.to_thread(self._search_channel, channel_name, published_after, published_before, region_code, order, max_results, no_cache)
 
-            if not next_page_token:
-                logger.debug("No more pages available")
-                break
-        
-        logger.info(f"Channel search completed. Found {total_results} total results, returning {len(lst)} channels")
-        return ChannelResults(
-            total_results=total_results,
-            channels=lst
-        ).model_dump_json()
+    def _search_channel(self, channel_name: str,  published_after: str = None, published_before: str = None, region_code: str = 'US', order: str = 'relevance', max_results: int = 50, no_cache: bool = False) -> ChannelResults:
+        """
+        Blocking implementation of `search_channel`, run in a worker thread.
+        """
+        channels, total_results = self._paginated_search(
+            'channel', _parse_channel_search_item, max_results, not no_cache,
+            **_search_params(channel_name, CHANNEL_SEARCH_FIELDS, published_after, published_before, region_code, order)
+        )
+        return _dumps(ChannelResults.model_construct(total_results=total_results, channels=channels))
 
-    def search_playlist(self, query: str, published_after: str = None, published_before: str = None, region_code: str = 'US', order: str = 'date', max_results: int = 50) -> PlaylistResults:
+    async def search_playlist(self, query: str, published_after: str = None, published_before: str = None, region_code: str = 'US', order: str = 'date', max_results: int = 50, no_cache: bool = False) -> PlaylistResults:
         """
         Searches for YouTube playlists based on the provided query.
 
@@ -261,68 +714,24 @@ class YouTubeTool:
             region_code (str): The regionCode parameter instructs the API to return search results for the specified country. The parameter value is an ISO 3166-1 alpha-2 country code.
             order (str): The order in which to return results. Default is 'date'. Options include 'date', 'rating', 'relevance', 'title', 'videoCount', and 'viewCount'.
             max_results (int): The maximum number of results to return. Default is 50.
+            no_cache (bool): Skip the response cache and fetch fresh results. Default is False.
 
         Returns:
             PlaylistResults: A list of playlists that match the search
         """
-        logger.info(f"Searching for playlists with query: {query}, max_results: {max_results}")
-        logger.debug(f"Search parameters: published_after={published_after}, published_before={published_before}, region_code={region_code}, order={order}")
-        
-        lst = []
-        total_results = 0
-        next_page_token = None
+        return await asyncio.to_thread(self._search_playlist, query, published_after, published_before, region_code, order, max_results, no_cache)
 
-        while len(lst) < max_results:
-            current_max = min(50, max_results - len(lst))
-            logger.debug(f"Fetching next {current_max} playlist results, current count: {len(lst)}")
-            
-            request = self.service.search().list(
-                part='snippet',
-                q=query,
-                type='playlist',
-                maxResults=current_max,
-                order=order,
-                publishedAfter=published_after,
-                publishedBefore=published_before,
-                regionCode=region_code,                
-                pageToken=next_page_token
-            )
-            response = request.execute()
-
-            time.sleep(1)  # Rate limit to avoid hitting API limits
-
-            logger.debug(f"Playlist search response received with {len(response.get('items', []))} items")
-
-            for item in response['items']:
-                playlist_id = item['id'].get('playlistId')
-                playlist_title = item['snippet'].get('title')
-                channel_id = item['snippet'].get('channelId')
-                playlist_description = item['snippet'].get('description')
-                playlist_published_at = item['snippet'].get('publishedAt')
-                playlist_info = PlaylistInfo(
-                    playlist_id=playlist_id,
-                    playlist_title=playlist_title,
-                    channel_id=channel_id,
-                    description=playlist_description,
-                    published_at=playlist_published_at
-                )
-                lst.append(playlist_info)
-
-            total_results = response['pageInfo']['totalResults']
-            next_page_token = response.get('nextPageToken')
-            logger.debug(f"Retrieved {len(response.get('items', []))} playlists, next_page_token: {next_page_token}")
-
-            if not next_page_token:
-                logger.debug("No more pages available")
-                break
-
-        logger.info(f"Playlist search completed. Found {total_results} total results, returning {len(lst)} playlists")
-        return PlaylistResults(
-            total_results=total_results,
-            playlists=lst
-        ).model_dump_json()
+    def _search_playlist(self, query: str, published_after: str = None, published_before: str = None, region_code: str = 'US', order: str = 'date', max_results: int = 50, no_cache: bool = False) -> PlaylistResults:
+        """
+        Blocking implementation of `search_playlist`, run in a worker thread.
+        """
+        playlists, total_results = self._paginated_search(
+            'playlist', _parse_playlist_search_item, max_results, not no_cache,
+            **_search_params(query, PLAYLIST_SEARCH_FIELDS, published_after, published_before, region_code, order)
+        )
+        return _dumps(PlaylistResults.model_construct(total_results=total_results, playlists=playlists))
 
-    def search_videos(self, query: str,  published_after: str = None, published_before: str = None, region_code: str = 'US', video_duration: str = 'any', order: str = 'date', max_results: int = 50) -> VideoResults:
+    async def search_videos(self, query: str,  published_after: str = None, published_before: str = None, region_code: str = 'US', video_duration: str = 'any', order: str = 'date', max_results: int = 50, no_cache: bool = False) -> VideoResults:
         """
         Searches for YouTube videos based on the provided query.
 
@@ -334,213 +743,371 @@ class YouTubeTool:
             video_duration (str): The videoDuration parameter filters video search results based on their duration. Default is 'Any'. Options include 'any', 'long', 'medium', 'short'.
             order (str): The order in which to return results. Default is 'date'. Options include 'date', 'rating', 'relevance', 'title', 'videoCount', and 'viewCount'.
             max_results (int): The maximum number of results to return. Default is 50.
+            no_cache (bool): Skip the response cache and fetch fresh results. Default is False.
 
         Returns:
             VideoResults: A list of videos that match the search
         """
-        logger.info(f"Searching for videos with query: {query}, max_results: {max_results}")
-        logger.debug(f"Search parameters: published_after={published_after}, published_before={published_before}, region_code={region_code}, video_duration={video_duration}, order={order}")
-        
-        lst = []
-        total_results = 0
-        next_page_token = None
+        return await asyncio.to_thread(self._search_videos, query, published_after, published_before, region_code, video_duration, order, max_results, no_cache)
 
-        while len(lst) < max_results:
-            current_max = min(50, max_results - len(lst))
-            logger.debug(f"Fetching next {current_max} video results, current count: {len(lst)}")
-            
-            request = self.service.search().list(
-                part='snippet',
-                q=query,
-                type='video',
-                maxResults=current_max,
-                order=order,
-                publishedAfter=published_after,
-                publishedBefore=published_before,
-                regionCode=region_code,
-                videoDuration=video_duration,
-                pageToken=next_page_token
+    def _search_videos(self, query: str,  published_after: str = None, published_before: str = None, region_code: str = 'US', video_duration: str = 'any', order: str = 'date', max_results: int = 50, no_cache: bool = False) -> VideoResults:
+        """
+        Blocking implementation of `search_videos`, run in a worker thread.
+        """
+        videos, total_results = self._paginated_search(
+            'video', _parse_video_search_item, max_results, not no_cache,
+            **_search_params(query, VIDEO_SEARCH_FIELDS, published_after, published_before, region_code, order, videoDuration=video_duration)
+        )
+        self._prefetch_details([video.video_id for video in videos])
+        return _dumps(VideoResults.model_construct(total_results=total_results, videos=videos))
+
+    async def iter_search_videos(self, query: str,  published_after: str = None, published_before: str = None, region_code: str = 'US', video_duration: str = 'any', order: str = 'date', no_cache: bool = False) -> AsyncIterator[VideoInfo]:
+        """
+        Lazily search for YouTube videos, requesting the next page only once the previous one has been consumed.
+
+        Args:
+            query (str): The query to search for.
+            published_after (str): Only return videos published at or after this RFC 3339 date-time.
+            published_before (str): Only return videos published before or at this RFC 3339 date-time.
+            region_code (str): ISO 3166-1 alpha-2 country code to return search results for.
+            video_duration (str): Filter on video duration. Options include 'any', 'long', 'medium', 'short'.
+            order (str): The order in which to return results. Default is 'date'.
+            no_cache (bool): Skip the response cache and fetch fresh results. Default is False.
+
+        Yields:
+            VideoInfo: One video that matches the search
+        """
+        items = self._iter_search(
+            'video', {}, use_cache=not no_cache,
+            **_search_params(query, VIDEO_SEARCH_FIELDS, published_after, published_before, region_code, order, videoDuration=video_duration)
+        )
+        # Each page is fetched in a worker thread so the event loop is never blocked
+        while (item := await asyncio.to_thread(next, items, None)) is not None:
+            yield _parse_video_search_item(item)
+
+    def _prefetch_details(self, video_ids: list[str]) -> None:
+        """
+        Start fetching detailed information for the given videos in the background.
+        """
+        if not self.prefetch_video_details:
+            return
+
+        with self._prefetch_lock:
+            now = time.monotonic()
+            video_ids = [
+                video_id for video_id in dict.fromkeys(video_ids)
+                if video_id and not self._is_fresh_prefetch(self._prefetched_videos.get(video_id), now)
+            ]
+            if not video_ids:
+                return
+            future = self._prefetch_executor.submit(self._fetch_video_details, video_ids)
+            for video_id in video_ids:
+                # Re-insert so a refreshed entry moves to the end of the eviction order
+                self._prefetched_videos.pop(video_id, None)
+                self._prefetched_videos[video_id] = (now, future)
+            # Evict the oldest entries, dicts keep insertion order
+            while len(self._prefetched_videos) > self.MAX_PREFETCHED_VIDEOS:
+                del self._prefetched_videos[next(iter(self._prefetched_videos))]
+
+        # Outside the lock: the callback runs right away if the future already finished
+        future.add_done_callback(functools.partial(self._on_prefetch_done, video_ids))
+        logger.debug("Prefetching details for %d videos", len(video_ids))
+
+    @staticmethod
+    def _is_fresh_prefetch(entry: tuple[float, Future] | None, now: float) -> bool:
+        """
+        Check whether a prefetched entry started recently enough to satisfy the `videos().list` cache TTL.
+        """
+        return entry is not None and now - entry[0] < CACHE_TTLS['youtube.videos.list']
+
+    def _discard_prefetched(self, video_ids: list[str], future: Future) -> None:
+        """
+        Forget the prefetched entries of `video_ids` that still point at `future`.
+        """
+        with self._prefetch_lock:
+            for video_id in video_ids:
+                entry = self._prefetched_videos.get(video_id)
+                if entry is not None and entry[1] is future:
+                    del self._prefetched_videos[video_id]
+
+    def _on_prefetch_done(self, video_ids: list[str], future: Future) -> None:
+        """
+        Drop a failed prefetch so its videos can be prefetched again.
+        """
+        if not future.cancelled() and future.exception() is not None:
+            self._discard_prefetched(video_ids, future)
+
+    def _fetch_video_details(self, video_ids: list[str], use_cache: bool = True) -> dict[str, VideoInfo]:
+        """
+        Fetch detailed information for the given videos, keyed by video ID.
+
+        IDs are split into `videos().list` sized chunks which are fetched concurrently
+        over the shared HTTP/2 connection.
+        """
+        chunks = [video_ids[start:start + MAX_IDS_PER_REQUEST] for start in range(0, len(video_ids), MAX_IDS_PER_REQUEST)]
+
+        def fetch(chunk: list[str]) -> dict:
+            request = self.service.videos().list(
+                part=VIDEO_DETAIL_PARTS,
+                id=','.join(chunk),
+                fields=VIDEO_DETAIL_FIELDS
             )
-            response = request.execute()
-
-            time.sleep(1)  # Rate limit to avoid hitting API limits
-
-            logger.debug(f"Video search response received with {len(response.get('items', []))} items")
-
-            for item in response['items']:
-                channel_id = item['snippet'].get('channelId')
-                channel_title = item['snippet'].get('channelTitle')
-                video_id = item['id'].get('videoId')
-                video_title = item['snippet'].get('title')
-                video_description = item['snippet'].get('description')
-                video_published = item['snippet'].get('publishTime')
-                video_info = VideoInfo(
-                    channel_id=channel_id,
-                    channel_title=channel_title,
-                    video_id=video_id,
-                    video_title=video_title,
-                    description=video_description,
-                    published_at=video_published
-                )
-                lst.append(video_info)
-
-            total_results = response['pageInfo']['totalResults']
-            next_page_token = response.get('nextPageToken')
-            logger.debug(f"Retrieved {len(response.get('items', []))} videos, next_page_token: {next_page_token}")
+            return self._execute(request, use_cache)
 
-            if not next_page_token:
-                logger.debug("No more pages available")
-                break
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_REQUESTS, len(chunks))) as executor:
+                responses = list(executor.map(fetch, chunks))
+        else:
+            responses = [fetch(chunk) for chunk in chunks]
 
-        logger.info(f"Video search completed. Found {total_results} total results, returning {len(lst)} videos")
-        return VideoResults(
-            total_results=total_results,
-            videos=lst
-        ).model_dump_json()
+        details = {}
+        for response in responses:
+            items = response.get('items', [])
+            logger.debug("Video info response received with %d items", len(items))
+            for item in items:
+                details[item['id']] = _parse_video_details(item)
+        return details
 
-    def get_video_info(self, video_ids: str, max_results: int = 50) -> VideoResults:
+    async def _get_prefetched_details(self, video_ids: list[str]) -> list[VideoInfo] | None:
+        """
+        Return prefetched details for `video_ids`, or None unless every ID was prefetched successfully within the `videos().list` cache TTL.
+        """
+        with self._prefetch_lock:
+            now = time.monotonic()
+            entries = [self._prefetched_videos.get(video_id) for video_id in video_ids]
+        if not entries or not all(self._is_fresh_prefetch(entry, now) for entry in entries):
+            return None
+
+        futures = list(dict.fromkeys(entry[1] for entry in entries))
+        details = {}
+        try:
+            for future in futures:
+                details.update(await asyncio.wrap_future(future))
+        except Exception as e:
+            logger.debug("Prefetched video details unavailable: %s", e)
+            return None
+        finally:
+            # Each prefetched entry is served once; failed ones are dropped as well
+            for future in futures:
+                self._discard_prefetched(video_ids, future)
+
+        return [details[video_id] for video_id in video_ids if video_id in details]
+
+    async def get_video_info(self, video_ids: str, max_results: int = 50, no_cache: bool = False) -> VideoResults:
         """
         Retrieves detailed information about YouTube videos based on the provided video IDs in a comma-separated string.
 
         Args:
             video_ids (str): A comma-separated string of video IDs. For example: 'dQw4w9WgXcQ,3fumBcKC6RE'
             max_results (int): The maximum number of results to return. Default is 50.
+            no_cache (bool): Skip the response cache and fetch fresh results. Default is False.
 
         Returns:
             VideoResults: A list of videos with detailed information
         """
-        logger.info(f"Getting video info for video_ids: {video_ids}, max_results: {max_results}")
-        
-        lst = []
-        total_results = 0
-        next_page_token = None
+        # Duplicate IDs are dropped up front so both the prefetched and the fetched path return each video once
+        requested_ids = list(dict.fromkeys(video_id.strip() for video_id in video_ids.split(',') if video_id.strip()))[:max(0, max_results)]
+        prefetched = None if no_cache else await self._get_prefetched_details(requested_ids)
+        if prefetched is not None:
+            logger.info("Serving video info for %d videos from prefetched details", len(requested_ids))
+            return _dumps(VideoResults.model_construct(total_results=len(prefetched), videos=prefetched))
 
-        while len(lst) < max_results:
-            current_max = min(50, max_results - len(lst))
-            logger.debug(f"Fetching next {current_max} video details, current count: {len(lst)}")
-            
-            request = self.service.videos().list(
-                part='id,snippet,contentDetails,statistics,paidProductPlacementDetails,topicDetails', 
-                id=video_ids,
-                maxResults=current_max,
-                pageToken=next_page_token
-            )
-            response = request.execute()
-
-            time.sleep(1)  # Rate limit to avoid hitting API limits
-
-            logger.debug(f"Video info response received with {len(response.get('items', []))} items")
-
-            for item in response['items']:
-                snippet = item['snippet']
-                content_details = item.get('contentDetails', {})
-                statistics = item.get('statistics', {})
-                topic_details = item.get('topicDetails', {})
-
-                video_info = VideoInfo(
-                    channel_id=snippet['channelId'],
-                    channel_title=snippet['channelTitle'],
-                    video_id=item['id'],
-                    video_title=snippet['title'],
-                    description=snippet.get('description', ''),
-                    published_at=snippet['publishedAt'],
-                    tags=snippet.get('tags', []),
-                    duration=content_details.get('duration'),
-                    dimension=content_details.get('dimension'),
-                    view_count=statistics.get('viewCount'),
-                    like_count=statistics.get('likeCount', 0),
-                    comment_count=statistics.get('commentCount', 0),
-                    topic_categories=topic_details.get('topicCategories', []),
-                    has_paid_product_placement=snippet.get('hasPaidPromotion', False)
-                )
-                lst.append(video_info)
-
-            total_results = response['pageInfo']['totalResults']
-            next_page_token = response.get('nextPageToken')
-            logger.debug(f"Retrieved {len(response.get('items', []))} video details, next_page_token: {next_page_token}")
+        return await asyncio.to_thread(self._get_video_info, requested_ids, no_cache)
 
-            if not next_page_token:
-                logger.debug("No more pages available")
-                break
+    def _get_video_info(self, video_ids: list[str], no_cache: bool = False) -> VideoResults:
+        """
+        Blocking implementation of `get_video_info`, run in a worker thread.
+        """
+        logger.info("Getting video info for video_ids: %s", ','.join(video_ids))
 
-        logger.info(f"Video info retrieval completed. Found {total_results} total results, returning {len(lst)} videos")
-        return VideoResults(
+        # videos().list doesn't paginate ID lookups, it caps them at 50 IDs per request
+        details = self._fetch_video_details(video_ids, use_cache=not no_cache)
+        lst = [details[video_id] for video_id in video_ids if video_id in details]
+        total_results = len(lst)
+
+        logger.info("Video info retrieval completed. Found %s total results, returning %d videos", total_results, len(lst))
+        return _dumps(VideoResults.model_construct(
             total_results=total_results,
             videos=lst
-        ).model_dump_json()
+        ))
 
-    def get_channel_videos(self, channel_id: str, max_results: int = 10) -> VideoResults:
+    async def get_videos_info_batch(self, video_ids: list[str], no_cache: bool = False) -> VideoResults:
         """
-        Return videos uploaded by a YouTube channel based on the provided channel ID.
+        Retrieves detailed information about many YouTube videos at once using a single batched HTTP request. Prefer this over several get_video_info calls when multiple video IDs are involved.
 
         Args:
-            channel_id (str): The ID of the YouTube channel.
-            max_results (int): The maximum number of results to return. Default is 50.
+            video_ids (list[str]): The IDs of the videos to look up. For example: ['dQw4w9WgXcQ', '3fumBcKC6RE']
+            no_cache (bool): Skip the response cache and fetch fresh results. Default is False.
 
         Returns:
-            VideoResults: A list of videos uploaded by the channel
+            VideoResults: A list of videos with detailed information
         """
-        logger.info(f"Getting videos for channel_id: {channel_id}, max_results: {max_results}")
-        
+        prefetched = None if no_cache else await self._get_prefetched_details(video_ids)
+        if prefetched is not None:
+            logger.info("Serving batched video info for %d videos from prefetched details", len(video_ids))
+            return _dumps(VideoResults.model_construct(total_results=len(prefetched), videos=prefetched))
+
+        return await asyncio.to_thread(self._get_videos_info_batch, video_ids, no_cache)
+
+    def _get_videos_info_batch(self, video_ids: list[str], no_cache: bool = False) -> VideoResults:
+        """
+        Blocking implementation of `get_videos_info_batch`, run in a worker thread.
+        """
+        logger.info("Getting batched video info for %d videos", len(video_ids))
+
+        # Each sub-request covers as many IDs as videos().list accepts
+        responses = self._execute_batch({
+            str(i): functools.partial(
+                self.service.videos().list,
+                part=VIDEO_DETAIL_PARTS,
+                id=','.join(video_ids[start:start + MAX_IDS_PER_REQUEST]),
+                fields=VIDEO_DETAIL_FIELDS
+            )
+            for i, start in enumerate(range(0, len(video_ids), MAX_IDS_PER_REQUEST))
+        }, use_cache=not no_cache)
+
         lst = []
         total_results = 0
-        next_page_token = None
+        for request_id in sorted(responses, key=int):
+            response = responses[request_id]
+            total_results += response['pageInfo']['totalResults']
+            for item in response.get('items', []):
+                lst.append(_parse_video_details(item))
+
+        logger.info("Batched video info retrieval completed. Found %s total results, returning %d videos", total_results, len(lst))
+        return _dumps(VideoResults.model_construct(
+            total_results=total_results,
+            videos=lst
+        ))
+
+    def _get_uploads_playlist_ids(self, channel_ids: list[str], use_cache: bool = True) -> dict[str, str]:
+        """
+        Resolve the uploads playlist of each channel, fetching only the channels not cached yet.
+
+        Args:
+            channel_ids (list[str]): The IDs of the YouTube channels.
+
+        Returns:
+            dict[str, str]: Uploads playlist IDs keyed by channel ID. Unknown channels are left out.
+        """
+        missing = [channel_id for channel_id in dict.fromkeys(channel_ids) if channel_id not in self._uploads_playlist_cache]
 
-        while len(lst) < max_results:
-            logger.debug(f"Retrieving uploads playlist ID for channel: {channel_id}")
+        # channels().list resolves up to 50 uploads playlists in a single request
+        for start in range(0, len(missing), MAX_IDS_PER_REQUEST):
+            logger.debug("Retrieving uploads playlist IDs for %d channels", len(missing[start:start + MAX_IDS_PER_REQUEST]))
             request = self.service.channels().list(
                 part='contentDetails',
-                id=channel_id
+                id=','.join(missing[start:start + MAX_IDS_PER_REQUEST]),
+                fields=UPLOADS_PLAYLIST_FIELDS
             )
-            response = request.execute()
-            logger.debug(f"Channel details response received with {len(response.get('items', []))} items")
+            response = self._execute(request, use_cache)
+            for item in response.get('items', []):
+                uploads_playlist_id = item['contentDetails']['relatedPlaylists'].get('uploads')
+                if uploads_playlist_id:
+                    self._uploads_playlist_cache[item['id']] = uploads_playlist_id
+
+        return {
+            channel_id: self._uploads_playlist_cache[channel_id]
+            for channel_id in channel_ids if channel_id in self._uploads_playlist_cache
+        }
+
+    async def get_channel_videos(self, channel_id: str, max_results: int = 10, no_cache: bool = False) -> VideoResults:
+        """
+        Return videos uploaded by a YouTube channel based on the provided channel ID.
 
-            uploads_playlist_id = response['items'][0]['contentDetails']['relatedPlaylists'].get('uploads')
-            logger.debug(f"Found uploads playlist ID: {uploads_playlist_id}")
+        Args:
+            channel_id (str): The ID of the YouTube channel.
+            max_results (int): The maximum number of results to return. Default is 50.
+            no_cache (bool): Skip the response cache and fetch fresh results. Default is False.
 
-            current_max = min(50, max_results - len(lst))
-            logger.debug(f"Fetching next {current_max} playlist items, current count: {len(lst)}")
-            
-            playlist_request = self.service.playlistItems().list(
-                part='snippet',
-                playlistId=uploads_playlist_id,
-                maxResults=current_max,
-                pageToken=next_page_token
-            )
-            playlist_response = playlist_request.execute()
-            
-            time.sleep(1)  # Rate limit to avoid hitting API limits
+        Returns:
+            VideoResults: A list of videos uploaded by the channel
+        """
+        return await asyncio.to_thread(self._get_channel_videos, channel_id, max_results, no_cache)
+
+    def _get_channel_videos(self, channel_id: str, max_results: int = 10, no_cache: bool = False) -> VideoResults:
+        """
+        Blocking implementation of `get_channel_videos`, run in a worker thread.
+        """
+        logger.info("Getting videos for channel_id: %s, max_results: %s", channel_id, max_results)
+        
+        uploads_playlist_id = self._get_uploads_playlist_ids([channel_id], use_cache=not no_cache).get(channel_id)
+        if not uploads_playlist_id:
+            logger.warning("No uploads found for channel: %s", channel_id)
+            return _dumps(VideoResults.model_construct(total_results=0, videos=[]))
+        logger.debug("Found uploads playlist ID: %s", uploads_playlist_id)
+
+        max_results = max(0, max_results)
+        page_info = {}
+        items = self._iter_pages(
+            self.service.playlistItems().list, page_info, max_results, use_cache=not no_cache,
+            part='snippet',
+            playlistId=uploads_playlist_id,
+            fields=PLAYLIST_ITEM_FIELDS
+        )
+        lst = [_parse_playlist_item_video(item) for item in itertools.islice(items, max_results)]
+        total_results = page_info.get('totalResults', 0)
+
+        logger.info("Channel videos retrieval completed. Found %s total videos, returning %d videos", total_results, len(lst))
+        self._prefetch_details([video.video_id for video in lst])
+        return _dumps(VideoResults.model_construct(
+            total_results=total_results,
+            videos=lst
+        ))
+
+    async def get_channel_videos_bulk(self, channel_ids: list[str], max_results: int = 10, no_cache: bool = False) -> VideoResults:
+        """
+        Return the latest videos uploaded by several YouTube channels at once using batched HTTP requests. Prefer this over several get_channel_videos calls when multiple channels are involved.
 
-            logger.debug(f"Playlist items response received with {len(playlist_response.get('items', []))} items")
+        Args:
+            channel_ids (list[str]): The IDs of the YouTube channels.
+            max_results (int): The maximum number of videos to return per channel, up to 50. Default is 10.
+            no_cache (bool): Skip the response cache and fetch fresh results. Default is False.
 
-            for item in playlist_response['items']:
-                snippet = item['snippet']
+        Returns:
+            VideoResults: A list of videos uploaded by the channels
+        """
+        return await asyncio.to_thread(self._get_channel_videos_bulk, channel_ids, max_results, no_cache)
 
-                video_info = VideoInfo(
-                    channel_id=snippet['channelId'],
-                    channel_title=snippet['channelTitle'],
-                    video_id=snippet['resourceId']['videoId'],
-                    video_title=snippet['title'],
-                    description=snippet.get('description', ''),
-                    published_at=snippet['publishedAt'],
-                )
-                lst.append(video_info)
+    def _get_channel_videos_bulk(self, channel_ids: list[str], max_results: int = 10, no_cache: bool = False) -> VideoResults:
+        """
+        Blocking implementation of `get_channel_videos_bulk`, run in a worker thread.
+        """
+        logger.info("Getting videos for %d channels, max_results per channel: %s", len(channel_ids), max_results)
 
-            total_results = playlist_response['pageInfo']['totalResults']
-            next_page_token = playlist_response.get('nextPageToken')
-            logger.debug(f"Retrieved {len(playlist_response.get('items', []))} video items, next_page_token: {next_page_token}")
+        uploads_playlist_ids = self._get_uploads_playlist_ids(channel_ids, use_cache=not no_cache)
 
-            if not next_page_token:
-                logger.debug("No more pages available")
-                break
+        # The first page of every uploads playlist is fetched in one batched HTTP call
+        responses = self._execute_batch({
+            channel_id: functools.partial(
+                self.service.playlistItems().list,
+                part='snippet',
+                playlistId=playlist_id,
+                maxResults=min(MAX_IDS_PER_REQUEST, max_results),
+                fields=PLAYLIST_ITEM_FIELDS
+            )
+            for channel_id, playlist_id in uploads_playlist_ids.items() if playlist_id
+        }, use_cache=not no_cache)
 
-        logger.info(f"Channel videos retrieval completed. Found {total_results} total videos, returning {len(lst)} videos")
-        return VideoResults(
+        lst = []
+        total_results = 0
+        for channel_id in dict.fromkeys(channel_ids):
+            response = responses.get(channel_id)
+            if response is None:
+                logger.warning("No uploads found for channel: %s", channel_id)
+                continue
+            total_results += response['pageInfo']['totalResults']
+            for item in response.get('items', []):
+                lst.append(_parse_playlist_item_video(item))
+
+        logger.info("Bulk channel videos retrieval completed. Found %s total videos, returning %d videos", total_results, len(lst))
+        self._prefetch_details([video.video_id for video in lst])
+        return _dumps(VideoResults.model_construct(
             total_results=total_results,
             videos=lst
-        ).model_dump_json()
+        ))
     
-    def construct_hyperlink(self, id: str, type: str) -> str:
+    async def construct_hyperlink(self, id: str, type: str) -> str:
         """
         Construct a hyperlink based on the provided ID and type.
 
@@ -551,7 +1118,7 @@ class YouTubeTool:
         Returns:
             str: The hyperlink to the YouTube resource.
         """
-        logger.debug(f"Constructing hyperlink for {type} with id: {id}")
+        logger.debug("Constructing hyperlink for %s with id: %s", type, id)
         
         if type == 'channel':
             link = f'https://www.youtube.com/channel/{id}'
@@ -560,8 +1127,8 @@ class YouTubeTool:
         elif type == 'video':
             link = f'https://www.youtube.com/watch?v={id}'
         else:
-            logger.warning(f"Unknown resource type: {type}")
+            logger.warning("Unknown resource type: %s", type)
             link = ''
             
-        logger.debug(f"Constructed hyperlink: {link}")
+        logger.debug("Constructed hyperlink: %s", link)
         return link
\ No newline at end of file